@@ -1,15 +1,17 @@
 import argparse
+import fnmatch
 import importlib
 import importlib.machinery
 import importlib.util
 import inspect
+import re
 from types import ModuleType
 from typing import Any, Sequence, Type
 
 import loggi
 import quickpool
 from pathier import Pathier, Pathish
-from younotyou import Matcher, younotyou
+from younotyou import younotyou
 
 from .core import ChoresMixin, Gruel
 
@@ -25,6 +27,7 @@ class GruelFinder(loggi.LoggerMixin):
         file_include_patterns: list[str] = ["*.py"],
         recursive: bool = True,
         log_dir: Pathish = "logs",
+        quick_filter: bool = True,
     ):
         """#### :params:
 
@@ -42,6 +45,11 @@ class GruelFinder(loggi.LoggerMixin):
 
         `log_dir`: The directory this instance's log should be saved to.
 
+        `quick_filter`: Skip importing files whose text doesn't mention `Gruel`.
+        Importing executes a file's top-level code, so on large scan paths this
+        avoids most of the work. Disable if your scrapers inherit `Gruel` only
+        through intermediate base classes imported from other modules.
+
         Will find and load all classes in the "scrapers" directory that inherit from `Gruel`
         and start with "MySubGruel", but don't contain "Scratch" in the name:
         >>> finder = finder(["MySubGruel*"], ["*Scratch*"], "scrapers")
@@ -51,6 +59,10 @@ class GruelFinder(loggi.LoggerMixin):
         self.scan_path = scan_path or Pathier.cwd()
         self.file_include_patterns = file_include_patterns
         self.recursive = recursive
+        self.quick_filter = quick_filter
+        # Loaded modules keyed by resolved path + mtime so repeat `find()`
+        # calls skip re-compiling and re-executing unchanged files
+        self._module_cache: dict[tuple[str, int], ModuleType] = {}
         self.init_logger("gruel_finder", log_dir)
 
     def get_bases(self, object: Any) -> list[Any]:
@@ -87,12 +99,19 @@ class GruelFinder(loggi.LoggerMixin):
         return files
 
     def load_module_from_file(self, file: Pathier) -> ModuleType | None:
-        """Attempts to load and return a module from `file`."""
+        """Attempts to load and return a module from `file`.
+
+        Modules are cached per file, so loading the same unmodified file again
+        is a dict lookup instead of another compile + exec."""
         module_name = file.stem
         try:
+            cache_key = (str(file.resolve()), file.stat().st_mtime_ns)
+            if cached_module := self._module_cache.get(cache_key):
+                return cached_module
             module = importlib.machinery.SourceFileLoader(
                 module_name, str(file)
             ).load_module()
+            self._module_cache[cache_key] = module
             self.logger.info(f"Successfully imported `{module_name}` from `{file}`.")
             return module
         except Exception as e:
@@ -102,19 +121,36 @@ class GruelFinder(loggi.LoggerMixin):
         """Searches `modules` for classes that inherit from `Gruel` and are in `self.subgruel_classes`.
 
         Returns the list of classes."""
-        matcher = Matcher(self.subgruel_classes)
+        if not self.subgruel_classes:
+            return []
+        # One compiled regex union instead of a per-name fnmatch loop over the patterns
+        matches = re.compile(
+            "|".join(fnmatch.translate(pattern) for pattern in self.subgruel_classes)
+        ).match
         return [
             getattr(module, class_)
             for module in modules
             for class_ in dir(module)
-            if class_ in matcher and self.is_subgruel(getattr(module, class_))
+            if matches(class_) and self.is_subgruel(getattr(module, class_))
         ]
 
+    def _could_contain_gruel(self, file: Pathier) -> bool:
+        """Returns whether `file`'s raw bytes mention `Gruel` — a cheap
+        pre-filter (C-speed substring scan, no execution) before paying for an
+        import."""
+        try:
+            return b"Gruel" in file.read_bytes()
+        except Exception:
+            # Let the import attempt produce the logged failure
+            return True
+
     def find(self) -> list[Type[Gruel]]:
         """Run the scan and return `Gruel` subclasses."""
         files = self.glob_files()
         modules: list[ModuleType] = []
         for file in files:
+            if self.quick_filter and not self._could_contain_gruel(file):
+                continue
             if module := self.load_module_from_file(file):
                 modules.append(module)
         return self.strain_for_gruel(modules)
@@ -149,6 +185,7 @@ class Brewer(loggi.LoggerMixin, ChoresMixin):
         scraper_args: Sequence[Sequence[Any]] = [],
         scraper_kwargs: Sequence[dict[str, Any]] = [],
         log_dir: Pathish = "logs",
+        max_workers: int | None = None,
     ):
         """#### :params:
 
@@ -162,6 +199,11 @@ class Brewer(loggi.LoggerMixin, ChoresMixin):
 
         `log_dir`: The directory to store `Brewer` logs in. Defaults to "logs".
 
+        `max_workers`: The maximum number of scrapers to run concurrently.
+        Defaults to the executor's own default. Scraping is network bound but
+        parsing isn't — with hundreds of scrapers, capping this near your
+        bandwidth's sweet spot keeps the parse stages from thrashing the GIL.
+
         e.g.
         >>> class MyGruel(Gruel):
         >>>   def __init__(self, value:int):
@@ -187,6 +229,7 @@ class Brewer(loggi.LoggerMixin, ChoresMixin):
         self.scraper_kwargs: Sequence[dict[str, Any]] = (
             scraper_kwargs or [{}] * num_scrapers
         )
+        self.max_workers = max_workers
 
     def _prep_scrapers(self) -> list[tuple[Any, Sequence[Any], dict[str, Any]]]:
         return [
@@ -205,7 +248,9 @@ class Brewer(loggi.LoggerMixin, ChoresMixin):
             return scraper(*args, **kwargs).scrape()
 
         pool = quickpool.ThreadPool(
-            [execute] * len(self.scrapers), self._prep_scrapers()
+            [execute] * len(self.scrapers),
+            self._prep_scrapers(),
+            max_workers=self.max_workers,
         )
         return pool.execute()
 
@@ -1,13 +1,17 @@
 import abc
 import inspect
+import logging
+import threading
+from collections.abc import Sized
+from concurrent.futures import ThreadPoolExecutor
 
 import loggi
 from noiftimer import Timer
 from pathier import Pathier, Pathish
 from printbuddies import track
-from typing_extensions import Any, Sequence, override
+from typing_extensions import Any, Iterable, Sequence, override
 
-from .requests import Response, request
+from .requests import Response, Session, request
 
 
 class ChoresMixin:
@@ -31,6 +35,7 @@ class ParserMixin(abc.ABC):
         super().__init__()
         self.flush_items()
         self._show_parse_items_prog_bar = False
+        self.max_parse_workers = 1
 
     @property
     def show_parse_items_prog_bar(self) -> bool:
@@ -42,12 +47,16 @@ class ParserMixin(abc.ABC):
 
     def flush_items(self):
         """Flush `parsable_items` and `parsed_items`."""
-        self.parsable_items: list[Any] = []
+        self.parsable_items: Iterable[Any] = []
         self.parsed_items: list[Any] = []
 
     @abc.abstractmethod
-    def get_parsable_items(self, source: Any) -> list[Any]:
-        """Get atomic chunks to be parsed from `source` and return as a list."""
+    def get_parsable_items(self, source: Any) -> Iterable[Any]:
+        """Get atomic chunks to be parsed from `source`.
+
+        Usually returned as a list, but may be a generator when `source` is
+        large — items are then parsed as they're produced instead of all being
+        held in memory at once."""
 
     @abc.abstractmethod
     def parse_item(self, item: Any) -> Any:
@@ -75,10 +84,30 @@ class ParserMixin(abc.ABC):
         """
         return self.parse_item(item)
 
-    def parse_items(self, parsable_items: Sequence[Any]) -> list[Any]:
-        """Parse items and return them."""
+    def parse_items(self, parsable_items: Iterable[Any]) -> list[Any]:
+        """Parse items and return them.
+
+        Accepts any iterable, including generators, so large sources don't
+        have to be materialized up front (progress totals only display for
+        sized inputs).
+
+        Set `self.max_parse_workers` greater than 1 to parse with a thread pool —
+        worthwhile when `parse_item` does network i/o (e.g. fetching sub-pages).
+        Parsed items are returned in input order either way."""
+        total = len(parsable_items) if isinstance(parsable_items, Sized) else None
+        if self.max_parse_workers > 1:
+            with ThreadPoolExecutor(self.max_parse_workers) as executor:
+                return list(
+                    track(
+                        executor.map(self.parse_item_wrapper, parsable_items),
+                        total=total,
+                        disable=not self.show_parse_items_prog_bar,
+                    )
+                )
         parsed_items: list[Any] = []
-        for item in track(parsable_items, disable=not self.show_parse_items_prog_bar):
+        for item in track(
+            parsable_items, total=total, disable=not self.show_parse_items_prog_bar
+        ):
             parsed_item = self.parse_item_wrapper(item)
             parsed_items.append(parsed_item)
         return parsed_items
@@ -94,6 +123,8 @@ class ScraperMetricsMixin:
         self.fail_count: int = 0
         self.failed_to_get_parsable_items: bool = False
         self.unexpected_failure_occured: bool = False
+        # So count updates stay correct when items are parsed by a thread pool
+        self._count_lock = threading.Lock()
 
     @property
     def had_failures(self) -> bool:
@@ -143,14 +174,18 @@ class Gruel(ParserMixin, ScraperMetricsMixin, loggi.LoggerMixin, ChoresMixin):
         * `log_dir`: The directory this scraper's logs should be saved to.
         """
         super().__init__()
-        self._name = name
+        # Resolve once; `inspect.getsourcefile` walks module caches and hits
+        # the filesystem, and `name` is read for every log line
+        self._name = name or Pathier(inspect.getsourcefile(type(self))).stem  # type: ignore
         self.init_logger(self.name, log_dir)
         self.show_parse_items_prog_bar = show_parse_items_prog_bar
+        # Pooled session so repeated same-host requests reuse connections
+        self.session = Session(logger=self.logger)
 
     @property
     def name(self) -> str:
         """Returns the name given to __init__ or the stem of the file this instance was defined in if one wasn't given."""
-        return self._name or Pathier(inspect.getsourcefile(type(self))).stem  # type: ignore
+        return self._name
 
     def _fetch_and_parse(self):
         """Fetch source content and pass to parsing workflow."""
@@ -167,17 +202,27 @@ class Gruel(ParserMixin, ScraperMetricsMixin, loggi.LoggerMixin, ChoresMixin):
         """
         try:
             self.parsable_items = self.get_parsable_items(source)
-            self.logger.info(
-                f"{self.name}:get_parsable_items() returned {len(self.parsable_items)} items."
-            )
+            # Generators don't have a length to report; `%` style args so the
+            # stdlib logger skips formatting when INFO is disabled
+            if isinstance(self.parsable_items, Sized):
+                self.logger.info(
+                    "%s:get_parsable_items() returned %d items.",
+                    self.name,
+                    len(self.parsable_items),
+                )
         except Exception:
             self.failed_to_get_parsable_items = True
             self.logger.exception(f"Error in {self.name}:get_parsable_items().")
         else:
             self.parsed_items = self.parse_items(self.parsable_items)
-            self.logger.info(
-                f"Scrape completed in {self.timer.elapsed_str} with {self.success_count} successes and {self.fail_count} failures."
-            )
+            if self.logger.isEnabledFor(logging.INFO):
+                # Guarded since `elapsed_str` does real formatting work
+                self.logger.info(
+                    "Scrape completed in %s with %d successes and %d failures.",
+                    self.timer.elapsed_str,
+                    self.success_count,
+                    self.fail_count,
+                )
 
     @abc.abstractmethod
     def get_source(self) -> Any:
@@ -190,17 +235,21 @@ class Gruel(ParserMixin, ScraperMetricsMixin, loggi.LoggerMixin, ChoresMixin):
         """Returns a parsed item or `None` if parsing failed."""
         try:
             parsed_item = self.parse_item(item)
-            self.success_count += 1
+            with self._count_lock:
+                self.success_count += 1
             return parsed_item
         except Exception as e:
             self.logger.exception("Failure to parse item:")
             self.logger.error(str(item))
-            self.fail_count += 1
+            with self._count_lock:
+                self.fail_count += 1
             return None
 
     def request(self, *args: Any, **kwargs: Any) -> Response:
         """
-        Note: For convenience, passes this instances logger to the request functions
+        Note: For convenience, sends the request through this instance's pooled
+        `session` (which logs with this instance's logger) unless a `session`
+        kwarg is given
 
         Constructs and sends a :class:`Request <Request>`.
 
@@ -234,7 +283,7 @@ class Gruel(ParserMixin, ScraperMetricsMixin, loggi.LoggerMixin, ChoresMixin):
         `stream`: if ``False``, the response content will be immediately downloaded.
         `cert`: if String, path to ssl client cert file (.pem). If Tuple, ('cert', 'key') pair.
         """
-        kwargs["logger"] = self.logger
+        kwargs.setdefault("session", self.session)
         return request(*args, **kwargs)
 
     def scrape(self):
@@ -254,6 +303,7 @@ class Gruel(ParserMixin, ScraperMetricsMixin, loggi.LoggerMixin, ChoresMixin):
             self.unexpected_failure_occured = True
             self.logger.exception(f"Unexpected failure in {self.name}:scrape()")
         self.postscrape_chores()
+        self.session.close()
         self.logger.close()
 
     @abc.abstractmethod
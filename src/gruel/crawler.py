@@ -1,7 +1,10 @@
 import abc
-import time
+import threading
 from collections import deque
-from concurrent.futures import Future, ThreadPoolExecutor
+from collections.abc import Sized
+from functools import lru_cache
+from hashlib import blake2b
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
 
 import loggi
@@ -16,7 +19,40 @@ from typing_extensions import Any, Callable, Sequence, override
 
 from .core import ChoresMixin, ParserMixin, ScraperMetricsMixin
 from .models import Url
-from .requests import Response, SeleniumResponse, request
+from .requests import Response, SelectolaxLinkScraper, SeleniumResponse, Session
+
+try:
+    from yarl import URL as _YarlUrl
+except ImportError:
+    _YarlUrl = None
+
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:
+    ScalableBloomFilter = None
+
+
+@lru_cache(maxsize=131072)
+def _canonical_key(address: str) -> str:
+    """Returns the schemeless, fragmentless dedup key for `address`.
+
+    Module level (rather than a method) so the cache never captures a
+    `UrlManager` instance, and bounded so memory can't grow with the crawl."""
+    if _YarlUrl is not None:
+        try:
+            normalized = _YarlUrl(address).human_repr()
+            return (normalized.partition("://")[2] or normalized).partition("#")[0]
+        except ValueError:
+            # yarl rejects malformed-but-common hrefs (bad ports, unclosed
+            # IPv6 brackets) that scraped pages routinely contain; fall back to
+            # the slice path rather than abort the page's link extraction
+            pass
+    # Slicing off the scheme matches what the urlsplit/urlunsplit round trip
+    # produced (`Url.__post_init__` already strips slashes/spaces) at a
+    # fraction of the cost
+    separator = address.find("://")
+    key = address[separator + 3 :] if separator != -1 else address
+    return key.partition("#")[0]
 
 root = Pathier(__file__).parent
 color_map = ColorMap()
@@ -41,38 +77,37 @@ class ThreadManager:
 
     def __init__(self, max_workers: int):
         self.max_workers = max_workers
-        self.workers: list[Future[Any]] = []
-
-    @property
-    def cancelled_workers(self) -> list[Future[Any]]:
-        """Returns a list of cancelled workers."""
-        return [worker for worker in self.workers if worker.cancelled()]
-
-    @property
-    def completed_workers(self) -> list[Future[Any]]:
-        """Returns a list of completed workers."""
-        return [
-            worker
-            for worker in self.workers
-            if worker.done() and worker not in self.cancelled_workers
-        ]
-
-    @property
-    def finished_workers(self) -> list[Future[Any]]:
-        """Returns a list of completed workers."""
-        return [worker for worker in self.workers if worker.done()]
+        # Only in-flight futures are stored so memory stays O(max_workers)
+        # instead of O(total futures submitted)
+        self._inflight: set[Future[Any]] = set()
+        self._num_submitted = 0
+        self._num_finished = 0
+        self._num_cancelled = 0
+        # Done-callbacks run in whichever worker thread finishes, so the
+        # counter updates need a lock to avoid losing increments
+        self._count_lock = threading.Lock()
+
+    def _discard_worker(self, future: Future[Any]):
+        """Drop `future` from the in-flight set and update counters.
+
+        Registered with `concurrent.futures.Future.add_done_callback()` by `add_future()`."""
+        self._inflight.discard(future)
+        with self._count_lock:
+            self._num_finished += 1
+            if future.cancelled():
+                self._num_cancelled += 1
 
     @property
     def num_cancelled_workers(self) -> int:
-        return len(self.cancelled_workers)
+        return self._num_cancelled
 
     @property
     def num_completed_workers(self) -> int:
-        return len(self.completed_workers)
+        return self._num_finished - self._num_cancelled
 
     @property
     def num_finished_workers(self) -> int:
-        return len(self.finished_workers)
+        return self._num_finished
 
     @property
     def num_running_workers(self) -> int:
@@ -80,30 +115,32 @@ class ThreadManager:
 
     @property
     def num_unfinished_workers(self) -> int:
-        return len(self.unfinished_workers)
+        return len(self._inflight)
 
     @property
     def num_workers(self) -> int:
-        return len(self.workers)
+        return self._num_submitted
 
     @property
     def open_slots(self) -> int:
-        """Returns the difference between max_workers and number of running workers."""
-        return self.max_workers - self.num_running_workers
+        """Returns the difference between max_workers and the number of in-flight workers."""
+        return self.max_workers - len(self._inflight)
 
     @property
     def running_workers(self) -> list[Future[Any]]:
         """Returns a list of currently executing futures."""
-        return [worker for worker in self.workers if worker.running()]
+        return [worker for worker in list(self._inflight) if worker.running()]
 
     @property
     def unfinished_workers(self) -> list[Future[Any]]:
         """Returns a list of unfinished futures."""
-        return [worker for worker in self.workers if not worker.done()]
+        return [worker for worker in list(self._inflight) if not worker.done()]
 
     def add_future(self, future: Future[Any]):
-        """Add a future to `self.workers`."""
-        self.workers.append(future)
+        """Track `future` until it finishes."""
+        self._num_submitted += 1
+        self._inflight.add(future)
+        future.add_done_callback(self._discard_worker)
 
     def cancel_workers(self):
         """Attempt to cancel any unfinished futures."""
@@ -127,28 +164,64 @@ class ThreadManager:
             ) as c:
                 while running_workers := self.running_workers:
                     c.update(num_running(running_workers))
+                    # Block until something finishes instead of busy-polling
+                    wait(running_workers, timeout=0.25, return_when=FIRST_COMPLETED)
 
 
 class UrlManager:
     """Manages crawled and uncrawled urls."""
 
-    def __init__(self):
-        self._crawled: deque[Url] = deque()
+    def __init__(self, error_rate: float = 1e-6):
+        """
+        Create a `UrlManager` instance.
+
+        #### :params:
+        * `error_rate`: The acceptable false positive rate for seen-url checks
+        when `pybloom-live` is installed (the `speedups` extra).
+        With the bloom filter, seen-url state is memory bounded instead of
+        growing with every url encountered; without it a plain `set` is used
+        and `error_rate` is ignored.
+        """
+        self._crawled: list[Url] = []
         self._uncrawled: deque[Url] = deque()
-        # Separate lists for schemeless urls so we don't have to restrip the whole list
-        # everytime we check if a url is already in the list
-        self._schemeless: deque[Url] = deque()
-        self._schemeless_crawled: deque[Url] = deque()
+        # Canonicalized urls for O(1) membership checks;
+        # the deques above keep crawl order where it matters
+        self._seen: Any = (
+            ScalableBloomFilter(initial_capacity=100_000, error_rate=error_rate)
+            if ScalableBloomFilter is not None
+            else set()
+        )
+        self._crawled_keys: set[bytes] = set()
+        # Individual container ops are GIL-atomic, but the check-then-add
+        # sequences below aren't; workers race through here concurrently
+        self._lock = threading.Lock()
+
+    def _hash_key(self, url: Url) -> bytes:
+        """Returns a 16 byte `blake2b` digest of `canonicalize(url)`.
+
+        Storing digests instead of full url strings cuts dedup memory ~10x
+        with negligible collision risk."""
+        return blake2b(self.canonicalize(url).encode(), digest_size=16).digest()
+
+    def canonicalize(self, url: Url) -> str:
+        """Returns the canonical string key used for url equivalence checks.
+
+        Uses `yarl` (C-accelerated) to normalize host casing and percent-encoding
+        when it's installed, otherwise falls back to `urllib`-based parsing.
+
+        Keys never include a scheme or fragment so urls differing only by
+        `http` vs `https` or by an in-page anchor collapse."""
+        return _canonical_key(url.address)
 
     @property
-    def crawled(self) -> deque[Url]:
+    def crawled(self) -> list[Url]:
         """Urls that have been or are currently being crawled."""
         return self._crawled
 
     @property
     def total(self) -> int:
         """Total crawled and uncrawled urls."""
-        return len(self._schemeless)
+        return len(self._seen)
 
     @property
     def uncrawled(self) -> deque[Url]:
@@ -160,36 +233,46 @@ class UrlManager:
         for url in urls:
             self._uncrawled.append(url)
 
-    def filter_urls(self, urls: Sequence[Url]) -> deque[Url]:
+    def filter_urls(self, urls: Sequence[Url]) -> list[Url]:
         """
         Filters out:
           * duplicate urls
           * already crawled urls
           * urls with schemes other than `http` and `https`
         """
-        filtered_urls: deque[Url] = deque()
-        for url in set(urls):
-            if not url.scheme.startswith("http"):
-                continue
-            # Prevents duplicates where only diff is http vs https
-            schemeless_url = url.schemeless
-            if schemeless_url not in self._schemeless:
-                self._schemeless.append(schemeless_url)
-                filtered_urls.append(url)
-        return filtered_urls
+        if not urls:
+            return []
+        # Key on the canonical hash so duplicates where the only diff
+        # is http vs https collapse in the dict build
+        keyed_urls = {
+            self._hash_key(url): url
+            for url in set(urls)
+            if url.scheme.startswith("http")
+        }
+        with self._lock:
+            if isinstance(self._seen, set):
+                # C-level set difference/union beats a per-url `in` loop
+                new_keys = keyed_urls.keys() - self._seen
+                self._seen |= new_keys
+            else:
+                # Bloom filter backend only supports per-key operations
+                # (`add()` returns `True` when the key was already present)
+                new_keys = [key for key in keyed_urls if not self._seen.add(key)]
+        return [keyed_urls[key] for key in new_keys]
 
     def get_uncrawled(self) -> Url | None:
         """Get an uncrawled url from the front of the list.
 
         Returns `None` if uncrawled list is empty."""
-        while self._uncrawled:
-            url = self._uncrawled.popleft()
-            schemeless_url = url.schemeless
-            # double check url hasn't been crawled (cause threading)
-            if schemeless_url not in self._schemeless_crawled:
-                self._schemeless_crawled.append(schemeless_url)
-                self._crawled.append(url)
-                return url
+        with self._lock:
+            while self._uncrawled:
+                url = self._uncrawled.popleft()
+                key = self._hash_key(url)
+                # double check url hasn't been crawled (cause threading)
+                if key not in self._crawled_keys:
+                    self._crawled_keys.add(key)
+                    self._crawled.append(url)
+                    return url
         return None
 
 
@@ -257,9 +340,7 @@ class LimitCheckerMixin:
     def get_limits(obj: Any) -> list[CrawlLimit]:
         """Returns a list of `CrawlLimit` instances from `obj`."""
         return [
-            member
-            for member in obj.__dict__.values()
-            if issubclass(type(member), CrawlLimit)
+            member for member in obj.__dict__.values() if isinstance(member, CrawlLimit)
         ]
 
     @property
@@ -290,12 +371,14 @@ class CrawlScraper(ParserMixin, ScraperMetricsMixin, loggi.LoggerMixin, ChoresMi
         """Returns a parsed item or `None` if parsing failed."""
         try:
             parsed_item = self.parse_item(item)
-            self.success_count += 1
+            with self._count_lock:
+                self.success_count += 1
             return parsed_item
         except Exception as e:
             self.logger.exception("Failure to parse item:")
             self.logger.error(str(item))
-            self.fail_count += 1
+            with self._count_lock:
+                self.fail_count += 1
             return None
 
     def scrape(self, source: Response):
@@ -304,9 +387,12 @@ class CrawlScraper(ParserMixin, ScraperMetricsMixin, loggi.LoggerMixin, ChoresMi
         """
         try:
             parsable_items = self.get_parsable_items(source)
-            self.logger.info(
-                f"Returned {len(parsable_items)} parsable items from `{source.url}`."
-            )
+            # Generators have no len(); letting it raise here would send the
+            # whole batch to the except branch and scrape nothing
+            if isinstance(parsable_items, Sized):
+                self.logger.info(
+                    f"Returned {len(parsable_items)} parsable items from `{source.url}`."
+                )
         except Exception as e:
             self.logger.exception(f"Error getting parsable items from `{source.url}`.")
         else:
@@ -314,8 +400,7 @@ class CrawlScraper(ParserMixin, ScraperMetricsMixin, loggi.LoggerMixin, ChoresMi
             # don't want to pull from shared `self.parsed_items` container
             # when storing items
             parsed_items = self.parse_items(parsable_items)
-            for item in parsed_items:
-                self.parsed_items.append(item)
+            self.parsed_items.extend(parsed_items)
             self.store_items(parsed_items)
 
     @abc.abstractmethod
@@ -360,12 +445,16 @@ class Crawler(loggi.LoggerMixin, ChoresMixin, LimitCheckerMixin):
         self.init_logger(log_name, log_dir)
         self.url_manager = custom_url_manager or UrlManager()
         self.thread_manager = ThreadManager(max_threads)
+        # One pooled session shared by all workers so same-host fetches
+        # reuse connections instead of redoing the TCP/TLS handshake
+        self.session = Session(logger=self.logger)
         self.timer = Timer()
         self.max_time = MaxTimeLimit(max_time, self.timer)
         self.max_depth = MaxDepthLimit(max_depth, self.thread_manager)
         self.same_site_only = same_site_only
         self._scrapers: list[CrawlScraper] = []
         self._was_cancelled = False
+        self._cached_limits: list[CrawlLimit] | None = None
         for scraper in scrapers:
             self.register_scraper(scraper)
 
@@ -380,18 +469,22 @@ class Crawler(loggi.LoggerMixin, ChoresMixin, LimitCheckerMixin):
     def finished(self) -> bool:
         """Returns `True` if there are no uncrawled urls and no unfinished threads."""
         return not (
-            self.url_manager.uncrawled or self.thread_manager.unfinished_workers
+            self.url_manager.uncrawled or self.thread_manager.num_unfinished_workers
         )
 
     @property
     @override
     def limits(self) -> list[CrawlLimit]:
-        limits = super().limits
-        # ? Should scraper limits only halt that particular scraper or the whole crawl
-        # ? Separate class or flag to have both options
-        for scraper in self.scrapers:
-            limits.extend(self.get_limits(scraper))
-        return limits
+        # Discovery scans `__dict__` of this instance and every scraper,
+        # so cache the result; `limits_exceeded` hits this every loop iteration
+        if self._cached_limits is None:
+            limits = super().limits
+            # ? Should scraper limits only halt that particular scraper or the whole crawl
+            # ? Separate class or flag to have both options
+            for scraper in self.scrapers:
+                limits.extend(self.get_limits(scraper))
+            self._cached_limits = limits
+        return self._cached_limits
 
     @property
     def scrapers(self) -> list[CrawlScraper]:
@@ -406,6 +499,7 @@ class Crawler(loggi.LoggerMixin, ChoresMixin, LimitCheckerMixin):
         """
         scraper.logger = self.logger
         self._scrapers.append(scraper)
+        self._cached_limits = None
 
     @property
     def starting_url(self) -> Url:
@@ -444,6 +538,10 @@ class Crawler(loggi.LoggerMixin, ChoresMixin, LimitCheckerMixin):
     def _update_progress(self, progress: Progress, task: TaskID):
         num_completed = self.thread_manager.num_completed_workers
         total = self.thread_manager.num_workers + len(self.url_manager.uncrawled)
+        # Only rebuild the description and push an update when the counts have changed
+        if (num_completed, total) == self._last_progress_counts:
+            return
+        self._last_progress_counts = (num_completed, total)
         progress.update(
             task,
             total=total,
@@ -456,14 +554,22 @@ class Crawler(loggi.LoggerMixin, ChoresMixin, LimitCheckerMixin):
         self._starting_url = Url(starting_url)
         self.url_manager.add_urls([self._starting_url])
         self.prescrape_chores()
+        # Rediscover limits in case any were attached after construction
+        self._cached_limits = None
+        self._last_progress_counts: tuple[int, int] | None = None
         with ThreadPoolExecutor(self.thread_manager.max_workers) as executor:
             try:
-                with Progress(*self.display_columns) as progress:
+                with Progress(
+                    *self.display_columns, refresh_per_second=4
+                ) as progress:
                     crawler = progress.add_task()
                     while not self.finished and not self.limits_exceeded:
                         self._dispatch_workers(executor)
                         self._update_progress(progress, crawler)
-                        time.sleep(0.1)
+                        # Sleep until a worker finishes instead of polling on a fixed grain
+                        # (the timeout keeps time-based limits responsive)
+                        if unfinished := self.thread_manager.unfinished_workers:
+                            wait(unfinished, timeout=1, return_when=FIRST_COMPLETED)
                     self._update_progress(progress, crawler)
                 self.print_exceeded_limits()
             except KeyboardInterrupt:
@@ -477,18 +583,30 @@ class Crawler(loggi.LoggerMixin, ChoresMixin, LimitCheckerMixin):
         self.postscrape_chores()
         self.logger.close()
 
-    def extract_crawlable_urls(self, linkscraper: scrapetools.LinkScraper) -> list[Url]:
+    def extract_crawlable_urls(
+        self, linkscraper: scrapetools.LinkScraper | SelectolaxLinkScraper
+    ) -> list[Url]:
         """Returns a list of urls that can be added to the crawl list."""
-        urls = [
-            Url(link).fragmentless
-            for link in linkscraper.get_links(
-                "page",
-                excluded_links=linkscraper.get_links("img"),
-                same_site_only=self.same_site_only,
-            )
+        # Exclude img links with a set instead of passing `excluded_links`,
+        # which does an O(num img links) scan per page link
+        img_links = set(linkscraper.get_links("img"))
+        links = [
+            link
+            for link in linkscraper.get_links("page", same_site_only=self.same_site_only)
+            if link not in img_links
         ]
-        if self.same_site_only:
-            urls = [url for url in urls if self.starting_url.is_same_site(url)]
+        if not self.same_site_only:
+            return [Url(link).fragmentless for link in links]
+        # Cheap substring pre-filter so off-site links never pay for `Url` parsing.
+        # Conservative: false positives fall through to `is_same_site`.
+        site = ".".join(self.starting_url.netloc.split(".")[-2:])
+        urls: list[Url] = []
+        for link in links:
+            if site not in link:
+                continue
+            url = Url(link).fragmentless
+            if self.starting_url.is_same_site(url):
+                urls.append(url)
         return urls
 
     @override
@@ -514,7 +632,7 @@ class Crawler(loggi.LoggerMixin, ChoresMixin, LimitCheckerMixin):
 
     def request_page(self, url: Url) -> Response:
         """Make a request to `url` and return the page."""
-        return request(url.address, logger=self.logger)
+        return self.session.request("get", url.address)
 
 
 class SeleniumCrawler(Crawler):
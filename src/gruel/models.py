@@ -1,20 +1,57 @@
 from dataclasses import dataclass
-from urllib.parse import SplitResult, urlsplit, urlunsplit
+from functools import lru_cache
+from urllib.parse import SplitResult, parse_qs, urlsplit, urlunsplit
 
-from typing_extensions import Self
+from typing_extensions import Any, Self
+
+try:
+    import tldextract
+except ImportError:
+    tldextract = None
+
+if tldextract is not None:
+    # Offline extractor using the bundled public suffix list so imports never
+    # trigger a network fetch
+    _extract_domain = tldextract.TLDExtract(suffix_list_urls=())
+else:
+    _extract_domain = None
+
+
+@lru_cache(maxsize=8192)
+def _split_address(address: str) -> SplitResult:
+    """`urlsplit`, cached so `Url` instances sharing an address share one parse."""
+    return urlsplit(address)
 
 
 @dataclass
 class Url:
+    # Crawls hold a `Url` per discovered link; slots drop the per-instance
+    # `__dict__` and make attribute reads direct offset loads
+    __slots__ = ("address", "_split", "_address_hash", "_registrable", "_query_params")
+
     address: str
 
     def __post_init__(self):
         self.address = self.address.strip("/ ")
 
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name == "address":
+            # Invalidate the cached parse, hash, and domain whenever the address
+            # changes (property setters funnel through here via `_from_parts`)
+            super().__setattr__("_split", None)
+            super().__setattr__("_address_hash", None)
+            super().__setattr__("_registrable", None)
+            super().__setattr__("_query_params", None)
+
     @property
     def _parsed(self) -> SplitResult:
-        """Returns this instance's `address` split into scheme, netloc, path, query, and fragment."""
-        return urlsplit(self.address.strip("/ "))
+        """Returns this instance's `address` split into scheme, netloc, path, query, and fragment.
+
+        Parsed once per address and cached; every part property reads this."""
+        if self._split is None:
+            self._split = _split_address(self.address.strip("/ "))
+        return self._split
 
     def _from_parts(
         self, scheme: str, netloc: str, path: str, query: str, fragment: str
@@ -66,6 +103,16 @@ class Url:
             self.scheme, self.netloc, self.path, query, self.fragment
         ).address
 
+    @property
+    def query_params(self) -> dict[str, list[str]]:
+        """The query string parsed into a dict of param names to value lists.
+
+        Parsed once per address and cached, so reading several params doesn't
+        re-run `parse_qs` each time."""
+        if self._query_params is None:
+            self._query_params = parse_qs(self.query, keep_blank_values=True)
+        return self._query_params
+
     @property
     def fragment(self) -> str:
         """The fragment portion of the url."""
@@ -92,11 +139,31 @@ class Url:
         """Returns a `Url` with no scheme."""
         return self._from_parts("", self.netloc, self.path, self.query, self.fragment)
 
+    @property
+    def _registrable_domain(self) -> str:
+        """The registrable domain of the netloc per the public suffix list,
+        e.g. `website.com` for `sub.website.com` and `shop.co.uk` for
+        `www.shop.co.uk`. Computed once per address.
+
+        Requires `tldextract` (`pip install gruel[speedups]`) — naive
+        "last two labels" splitting would conflate different sites under
+        multi-label suffixes like `co.uk`."""
+        if self._registrable is None:
+            assert _extract_domain is not None
+            parts = _extract_domain(self.netloc)
+            self._registrable = ".".join(part for part in (parts.domain, parts.suffix) if part)
+        return self._registrable
+
     def is_same_site(self, other: Self) -> bool:
-        """Returns `True` if `other` appears to be the same website/host."""
+        """Returns `True` if `other` appears to be the same website/host.
+
+        Subdomains (including `www`) are ignored. With `tldextract` installed
+        (`pip install gruel[speedups]`) this compares cached registrable
+        domains; otherwise it falls back to `www`-stripped netloc containment."""
+        if _extract_domain is not None:
+            return self._registrable_domain == other._registrable_domain
         netloc1 = self.netloc.removeprefix("www.")
         netloc2 = other.netloc.removeprefix("www.")
-        # Account for one being a subdomain of the other
         if len(netloc1) < len(netloc2):
             return netloc1 in netloc2
         return netloc2 in netloc1
@@ -105,11 +172,15 @@ class Url:
         return self.address
 
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, self.__class__) or not issubclass(
-            type(other), self.__class__
-        ):
-            raise ValueError(f"Can't compare `Url` object to non-`Url` object.")
-        return self.address == getattr(other, "address")
+        if self is other:
+            return True
+        if not isinstance(other, Url):
+            # Follow the standard protocol instead of raising so `Url` objects
+            # behave in heterogeneous sets/dicts without exception overhead
+            return NotImplemented
+        return self.address == other.address
 
     def __hash__(self) -> int:
-        return hash(self.address)
+        if self._address_hash is None:
+            self._address_hash = hash(self.address)
+        return self._address_hash
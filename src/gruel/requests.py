@@ -1,5 +1,15 @@
+import html
+import inspect
 import logging
-from typing import Any
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Collection, Literal, Sequence
+from urllib.parse import urlparse, urlunparse
 
 import loggi
 import requests
@@ -13,6 +23,168 @@ from seleniumuser.seleniumuser import User
 from typing_extensions import Self, override
 from whosyouragent import whosyouragent
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+    LexborHTMLParser = None
+
+try:
+    import lxml  # type: ignore # noqa: F401
+
+    default_soup_features = "lxml"
+except ImportError:
+    default_soup_features = "html.parser"
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+class SelectolaxLinkScraper:
+    """Link extraction backed by `selectolax`'s C parser (the Modest engine).
+
+    Mirrors the parts of the `scrapetools.LinkScraper` interface that `gruel`
+    uses, but parses 10-50x faster on large pages.
+    `Response.get_linkscraper()` returns this automatically when `selectolax`
+    is installed (part of the `speedups` extra)."""
+
+    _tag_attributes = [
+        ("a", "href"),
+        ("link", "href"),
+        ("source", "src"),
+        ("div", "src"),
+        ("div", "data-src"),
+        ("div", "data-url"),
+        ("div", "href"),
+    ]
+    _img_formats = (
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".svg",
+        ".bmp",
+        ".tiff",
+        ".eps",
+        ".gif",
+        ".jfif",
+        ".webp",
+        ".heif",
+        ".avif",
+        ".bat",
+        ".bpg",
+    )
+    _url_pattern = re.compile(
+        r"https?://(?:www\.)?[-a-zA-Z0-9@:%._\+~#=]{2,256}\.[a-z]{2,6}\b(?:[-a-zA-Z0-9@:%_\+.~#?&//=]*)"
+    )
+
+    def __init__(self, html_src: str, page_url: str):
+        self.source = html_src
+        self.parsed_url = urlparse(page_url)
+        self.page_links: list[str] = []
+        self.img_links: list[str] = []
+        self.script_links: list[str] = []
+
+    def _find_all(self, tree: Any, tag_name: str, attribute_name: str) -> list[str]:
+        """Returns `attribute_name` values for all `tag_name` nodes, skipping fragments."""
+        return [
+            value
+            for node in tree.css(tag_name)
+            if (value := node.attributes.get(attribute_name)) and "#" not in value
+        ]
+
+    def _process_links(self, links: list[str]) -> list[str]:
+        """Formats relative links, removes duplicates, and sorts in alphabetical order."""
+        formatted_links: set[str] = set()
+        for link in links:
+            link = (
+                link.strip(" \n\t\r")
+                .replace('"', "")
+                .replace("\\", "")
+                .replace("'", "")
+            )
+            if "@" in link or " " in link:
+                continue
+            parsed_url = urlparse(link)
+            if not parsed_url.scheme:
+                parsed_url = parsed_url._replace(scheme=self.parsed_url.scheme)
+            if not parsed_url.netloc:
+                parsed_url = parsed_url._replace(netloc=self.parsed_url.netloc)
+            formatted_links.add(urlunparse(parsed_url).strip("/"))
+        return sorted(formatted_links)
+
+    def filter_same_site(self, links: list[str]) -> list[str]:
+        """Filters out links that don't match `self.parsed_url.netloc`."""
+        netloc = self.parsed_url.netloc.removeprefix("www.")
+        return [
+            link
+            for link in links
+            if urlparse(link).netloc.removeprefix("www.") == netloc
+        ]
+
+    def scrape_page(self):
+        """Scrape all link types."""
+        assert HTMLParser is not None
+        tree = HTMLParser(self.source)
+        links: list[str] = []
+        for tag_name, attribute_name in self._tag_attributes:
+            links.extend(self._find_all(tree, tag_name, attribute_name))
+        links.extend(self._url_pattern.findall(html.unescape(self.source)))
+        self.page_links = self._process_links(links)
+        self.img_links = self._process_links(
+            self._find_all(tree, "img", "src") + self._find_all(tree, "img", "data-src")
+        )
+        self.script_links = self._process_links(self._find_all(tree, "script", "src"))
+        # Image links can hide in script/page urls
+        self.img_links = sorted(
+            set(self.img_links)
+            | {
+                link
+                for link in self.script_links + self.page_links
+                if any(ext in link for ext in self._img_formats)
+            }
+        )
+
+    def get_links(
+        self,
+        link_type: str = "all",
+        same_site_only: bool = False,
+        excluded_links: list[str] | None = None,
+    ) -> list[str]:
+        """Returns a list of urls found on the page.
+
+        :param link_type: Can be 'all', 'page', 'img', or 'script'.
+
+        :param same_site_only: Excludes external urls if True.
+
+        :param excluded_links: A list of urls to filter out of the results."""
+        match link_type:
+            case "all":
+                links = list(
+                    set(self.page_links + self.img_links + self.script_links)
+                )
+            case "page":
+                links = self.page_links
+            case "img":
+                links = self.img_links
+            case "script":
+                links = self.script_links
+            case _:
+                links = []
+        if same_site_only:
+            links = self.filter_same_site(links)
+        if excluded_links:
+            links = [link for link in links if link not in excluded_links]
+        return sorted(links)
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str, flags: int) -> re.Pattern[str]:
+    """`re.compile`, cached so repeat extractions across responses share one compile."""
+    return re.compile(pattern, flags)
+
 
 class Response(requests.Response):
     """
@@ -22,22 +194,117 @@ class Response(requests.Response):
     * `get_linkscraper()`
     """
 
-    def get_soup(self, features: str = "html.parser") -> BeautifulSoup:
-        """Returns a `BeautifulSoup` instance for this response."""
-        return BeautifulSoup(self.text, features)
+    def get_soup(self, features: str | None = None) -> BeautifulSoup:
+        """Returns a `BeautifulSoup` instance for this response.
+
+        `features` defaults to the C-backed `lxml` parser when `lxml` is
+        installed (part of the `speedups` extra), otherwise `html.parser`.
+
+        Feeds the raw body bytes so the parser does its own decode instead of
+        paying for `text`'s full-body `str` materialization first.
+        Bodies with no declared charset are sniffed with a strict C-speed
+        utf-8 decode rather than letting charset detection libraries chew
+        through them in Python.
 
-    def get_linkscraper(self) -> scrapetools.LinkScraper:
-        """Returns a `LinkScraper` object from a `Response`."""
-        linkscraper = scrapetools.LinkScraper(self.text, self.url)
-        linkscraper.scrape_page()
+        Repeat calls with the same `features` return the same parsed tree
+        instead of re-parsing the body."""
+        features = features or default_soup_features
+        # `getattr` default instead of `__init__` state b/c instances are
+        # created by re-classing base responses
+        cached: tuple[str, BeautifulSoup] | None = getattr(self, "_soup_cache", None)
+        if cached is not None and cached[0] == features:
+            return cached[1]
+        content = self.content
+        encoding = self.encoding
+        if encoding is None:
+            try:
+                content.decode("utf-8")
+                encoding = "utf-8"
+            except UnicodeDecodeError:
+                # Genuinely unknown non-utf-8 charset; let bs4 detect it
+                pass
+        soup = BeautifulSoup(content, features, from_encoding=encoding)
+        self._soup_cache = (features, soup)
+        return soup
+
+    def get_soup_streaming(self, features: str | None = None) -> BeautifulSoup:
+        """Returns a `BeautifulSoup` instance parsed straight from this
+        response's raw stream.
+
+        For memory constrained bulk scrapes of large pages: the body is fed to
+        the parser without being cached on the response, so the parsed tree is
+        the only copy kept rather than tree + body bytes.
+
+        The request must have been sent with `stream=True`, and the body can't
+        be read again afterwards (`content`/`text`/`get_soup` won't work)."""
+        assert self.raw is not None
+        # Have urllib3 undo any content-encoding as the parser reads
+        self.raw.decode_content = True
+        return BeautifulSoup(self.raw, features or default_soup_features)
+
+    def get_tree(self) -> "LexborHTMLParser":
+        """Returns a `selectolax.lexbor.LexborHTMLParser` for this response.
+
+        The fast path for scrapers that only need CSS selectors:
+        parses straight from the response bytes into a compact C tree,
+        roughly 10-20x faster than `get_soup()` with far less memory.
+        e.g. `response.get_tree().css_first("div.price").text()`
+
+        Repeat calls return the same tree instead of re-parsing the body.
+
+        Requires `selectolax` (part of the `speedups` extra)."""
+        if LexborHTMLParser is None:
+            raise ModuleNotFoundError(
+                "`get_tree()` requires `selectolax`. Install it directly or with `pip install gruel[speedups]`."
+            )
+        tree = getattr(self, "_tree_cache", None)
+        if tree is None:
+            tree = LexborHTMLParser(self.content)
+            self._tree_cache = tree
+        return tree
+
+    def re_find_all(
+        self, pattern: str | re.Pattern[str], flags: int = 0
+    ) -> list[Any]:
+        """Returns all matches of `pattern` in this response's text
+        (`re.findall` semantics — tuples of groups when the pattern has more
+        than one group).
+
+        The cheap path when only a field or two is needed from a page: a
+        single compiled-regex pass over the text instead of building a full
+        tree with `get_soup`. Compiled patterns are cached across responses.
+        e.g. `response.re_find_all(r'href="([^"]+)"')`"""
+        if isinstance(pattern, str):
+            pattern = _compile_pattern(pattern, flags)
+        return pattern.findall(self.text)
+
+    def get_linkscraper(self) -> scrapetools.LinkScraper | SelectolaxLinkScraper:
+        """Returns a link scraper object from a `Response`.
+
+        Uses the C-accelerated `SelectolaxLinkScraper` when `selectolax` is
+        installed, otherwise `scrapetools.LinkScraper`.
+
+        Repeat calls return the same scraper instead of re-parsing the body."""
+        linkscraper = getattr(self, "_linkscraper_cache", None)
+        if linkscraper is None:
+            linkscraper = (
+                SelectolaxLinkScraper(self.text, self.url)
+                if HTMLParser is not None
+                else scrapetools.LinkScraper(self.text, self.url)
+            )
+            linkscraper.scrape_page()
+            self._linkscraper_cache = linkscraper
         return linkscraper
 
     @classmethod
     def from_base_response(cls, response: requests.Response) -> Self:
-        """Convert a `requests.Response` object into a `gruel.Response` object."""
-        self = cls()
-        self.__dict__ = response.__dict__.copy()
-        return self
+        """Convert a `requests.Response` object into a `gruel.Response` object.
+
+        Re-classes the instance in place — safe since `Response` only adds
+        methods — instead of allocating a new object and shallow copying
+        `__dict__` for every request."""
+        response.__class__ = cls
+        return response  # type: ignore[return-value]
 
 
 class SeleniumResponse(Response):
@@ -56,6 +323,33 @@ class SeleniumResponse(Response):
     def text(self) -> str:
         return self._text
 
+    @override
+    def get_soup(self, features: str | None = None) -> BeautifulSoup:
+        """Returns a `BeautifulSoup` instance for this response.
+
+        Parses from `text` since selenium sourced responses have no byte body.
+
+        Repeat calls with the same `features` return the same parsed tree."""
+        features = features or default_soup_features
+        cached: tuple[str, BeautifulSoup] | None = getattr(self, "_soup_cache", None)
+        if cached is not None and cached[0] == features:
+            return cached[1]
+        soup = BeautifulSoup(self.text, features)
+        self._soup_cache = (features, soup)
+        return soup
+
+    @override
+    def get_tree(self) -> "LexborHTMLParser":
+        if LexborHTMLParser is None:
+            raise ModuleNotFoundError(
+                "`get_tree()` requires `selectolax`. Install it directly or with `pip install gruel[speedups]`."
+            )
+        tree = getattr(self, "_tree_cache", None)
+        if tree is None:
+            tree = LexborHTMLParser(self.text)
+            self._tree_cache = tree
+        return tree
+
     @classmethod
     def from_selenium_user(cls, user: User) -> Self:
         """
@@ -70,62 +364,269 @@ class SeleniumResponse(Response):
         return self
 
 
-retry_on_codes = [408, 413, 444, 499, 500, 502, 503, 504]
+# frozenset so urllib3's per-response `status in status_forcelist` check is O(1)
+retry_on_codes: frozenset[int] = frozenset({408, 413, 444, 499, 500, 502, 503, 504})
+
+_retry_supports_jitter = (
+    "backoff_jitter" in inspect.signature(urllib3.util.Retry.__init__).parameters
+)
+
+
+class _JitteredRetry(urllib3.util.Retry):
+    """`Retry` with jittered backoff for urllib3 versions predating `backoff_jitter`.
+
+    Deterministic `backoff_factor * 2**n` delays make parallel workers retry in
+    lockstep, hammering an already struggling server at the same instants;
+    jitter spreads them out."""
+
+    BACKOFF_MAX = 30
+
+    def get_backoff_time(self) -> float:
+        return min(
+            super().get_backoff_time() * (1 + random.uniform(0, 0.5)),
+            self.BACKOFF_MAX,
+        )
+
+_user_agent_pool: list[str] = []
+_user_agent_index = 0
+
+
+def _next_user_agent() -> str:
+    """Returns the next user agent string from a lazily built rotation pool.
+
+    `whosyouragent.get_agent()` does Python-level list work per call, so
+    generate a pool of distinct agents once and rotate through it; being a
+    set-built pool, consecutive requests always get different agents."""
+    global _user_agent_index
+    if not _user_agent_pool:
+        _user_agent_pool.extend({whosyouragent.get_agent() for _ in range(96)})
+    agent = _user_agent_pool[_user_agent_index % len(_user_agent_pool)]
+    _user_agent_index += 1
+    return agent
+
+
+# Positional parameter order of `requests.Session.request` after `method` and
+# `url`, used to map positionals to keywords on the HTTP/2 path
+_request_positional_params = (
+    "params",
+    "data",
+    "headers",
+    "cookies",
+    "files",
+    "auth",
+    "timeout",
+    "allow_redirects",
+    "proxies",
+    "hooks",
+    "stream",
+    "verify",
+    "cert",
+    "json",
+)
 
 
 class Session(requests.Session):
     @override
     def __init__(
         self,
-        randomize_useragent: bool = True,
+        randomize_useragent: bool | Literal["per-session", "per-request"] = True,
         clear_cookies: bool = True,
         retry_count: int = 3,
         retry_backoff_factor: float = 0.1,
-        retry_on_codes: list[int] = retry_on_codes,
+        retry_on_codes: Collection[int] = retry_on_codes,
         logger: loggi.Logger | logging.Logger | None = None,
+        http2: bool = False,
+        pool_connections: int = 32,
+        pool_maxsize: int = 32,
     ):
         """
         Create a `Session` object.
 
         #### :params:
-        `randomize_useragent`: If `True`, each request will have a randomized `User-Agent` string.
+        `randomize_useragent`: If `True` (or `"per-request"`), each request will have a randomized `User-Agent` string.
+        `"per-session"` randomizes once here and reuses that agent for the session's lifetime —
+        usually enough to defeat basic fingerprinting while skipping the per-request header write.
         `clear_cookies`: If `True`, cookies will be cleared from the session prior to each request.
         `retry_count`: The number of times to retry a failed request.
         `retry_backoff_factor`: For each failed request, the time before retrying will be `retry_backoff_factor * (2 ** retry_number)`
         `retry_on_codes`: List of status codes to retry requests on. Default is `[408, 413, 444, 499, 500, 502, 503, 504]`.
         `logger`: A logging instance to use.
+        `http2`: If `True`, requests are sent through an `httpx` client with HTTP/2
+        enabled, multiplexing concurrent same-host requests over one connection
+        instead of serializing behind HTTP/1.1 head-of-line blocking.
+        Requires `httpx[http2]` (`pip install gruel[http2]`). Retries on this
+        path are connection-level only (`httpx.HTTPTransport(retries=...)`);
+        `retry_backoff_factor`/`retry_on_codes` don't apply. This path also
+        ignores `clear_cookies` and returns `Response` objects without a
+        `.request` or `.history`.
+        `pool_connections`/`pool_maxsize`: Connection pool sizing. Should be at least
+        the number of threads sharing this session — an undersized pool silently
+        discards keep-alive connections and re-handshakes under concurrency.
         """
         super().__init__()
         self.randomize_useragent = randomize_useragent
+        if randomize_useragent == "per-session":
+            self.headers["User-Agent"] = _next_user_agent()
         self.clear_cookies = clear_cookies
         self.timeout = 10
+        # Set before `set_retry`, which mounts the adapters that use them
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
         self.set_retry(
             total=retry_count,
             backoff_factor=retry_backoff_factor,
-            status_forcelist=retry_on_codes,
+            status_forcelist=frozenset(retry_on_codes),
         )
         self.logger = logger
+        self._httpx: "httpx.Client | None" = None
+        if http2:
+            if httpx is None:
+                raise ModuleNotFoundError(
+                    "`http2=True` requires `httpx`. Install it with `pip install gruel[http2]`."
+                )
+            self._httpx = httpx.Client(
+                http2=True,
+                timeout=self.timeout,
+                transport=httpx.HTTPTransport(http2=True, retries=retry_count),
+            )
+        # Set `cache_ttl` to a number of seconds to serve repeat `GET`s for the
+        # same url/params/headers from memory instead of the network
+        self.cache_ttl: float | None = None
+        self._page_cache: OrderedDict[str, tuple[float, Response]] = OrderedDict()
+        self._page_cache_max_size = 128
+        self._page_cache_lock = threading.Lock()
 
     def set_retry(self, *args: Any, **kwargs: Any):
         """Set the retry policy for failed requests.
 
-        `*args` and `**kwargs` are any parameters accepted by `urllib3.util.Retry()`."""
-        retries = urllib3.util.Retry(*args, **kwargs)
-        self.mount("http://", requests.adapters.HTTPAdapter(max_retries=retries))
-        self.mount("https://", requests.adapters.HTTPAdapter(max_retries=retries))
+        `*args` and `**kwargs` are any parameters accepted by `urllib3.util.Retry()`.
+
+        Backoff delays are jittered by default (and capped at 30s) so parallel
+        workers don't retry a struggling server in lockstep; pass
+        `backoff_jitter=0` to restore deterministic delays on urllib3 >= 2."""
+        if _retry_supports_jitter:
+            kwargs.setdefault("backoff_jitter", 0.5)
+            kwargs.setdefault("backoff_max", 30)
+            retries = urllib3.util.Retry(*args, **kwargs)
+        else:
+            retries = _JitteredRetry(*args, **kwargs)
+        for scheme in ("http://", "https://"):
+            self.mount(
+                scheme,
+                requests.adapters.HTTPAdapter(
+                    max_retries=retries,
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.pool_maxsize,
+                    pool_block=False,
+                ),
+            )
 
     @override
     def prepare_request(self, request: requests.Request) -> requests.PreparedRequest:
-        if self.randomize_useragent:
-            self.headers["User-Agent"] = whosyouragent.get_agent()
+        if self.randomize_useragent and self.randomize_useragent != "per-session":
+            self.headers["User-Agent"] = _next_user_agent()
         if self.clear_cookies:
-            self.cookies = requests.cookies.RequestsCookieJar()
+            # Clearing in place avoids allocating a fresh jar per request
+            self.cookies.clear()
         return super().prepare_request(request)
 
     @override
-    def request(self, *args: Any, **kwargs: Any) -> Response:
-        response = super().request(*args, **kwargs)
-        return Response.from_base_response(response)
+    def request(self, method: str, url: str, *args: Any, **kwargs: Any) -> Response:
+        key = None
+        if self.cache_ttl and method.lower() == "get" and not args:
+            # Params/headers are part of the key so requests that vary them
+            # don't collide, they just miss
+            key = f"{url}|{kwargs.get('params')!r}|{kwargs.get('headers')!r}"
+            with self._page_cache_lock:
+                cached = self._page_cache.get(key)
+                if cached and time.monotonic() - cached[0] < self.cache_ttl:
+                    self._page_cache.move_to_end(key)
+                    return cached[1]
+        if self._httpx is not None:
+            if args:
+                # `requests.Session.request` accepts these positionally; map
+                # them onto keywords so the httpx path sees them too instead of
+                # silently dropping them
+                kwargs.update(zip(_request_positional_params, args))
+            response = self._request_http2(method, url, **kwargs)
+        else:
+            response = Response.from_base_response(
+                super().request(method, url, *args, **kwargs)
+            )
+        if key is not None:
+            with self._page_cache_lock:
+                self._page_cache[key] = (time.monotonic(), response)
+                self._page_cache.move_to_end(key)
+                while len(self._page_cache) > self._page_cache_max_size:
+                    self._page_cache.popitem(last=False)
+        return response
+
+    def batch_request(
+        self,
+        urls: Sequence[str],
+        method: str = "get",
+        max_workers: int = 16,
+        **kwargs: Any,
+    ) -> list[Response]:
+        """Send requests for `urls` concurrently and return their responses in input order.
+
+        The workload is network bound, so dispatching a batch through a thread
+        pool turns N serial round trips into roughly one — the go-to when
+        `get_parsable_items` needs to fetch many pages.
+
+        All requests share this session's connection pool; `**kwargs` are
+        passed through to each `request` call."""
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(lambda url: self.request(method, url, **kwargs), urls)
+            )
+
+    def _request_http2(self, method: str, url: str, **kwargs: Any) -> Response:
+        """Send a request through this session's HTTP/2 `httpx` client and
+        return the result as a `Response`.
+
+        Unlike the `requests` path, this ignores `clear_cookies` and the
+        returned `Response` has no `.request` or `.history`."""
+        assert self._httpx is not None
+        headers = dict(kwargs.pop("headers", None) or {})
+        if "allow_redirects" in kwargs:
+            # httpx spells this `follow_redirects`
+            kwargs["follow_redirects"] = kwargs.pop("allow_redirects")
+        if self.randomize_useragent == "per-session":
+            headers.setdefault("User-Agent", str(self.headers.get("User-Agent", "")))
+        elif self.randomize_useragent:
+            headers.setdefault("User-Agent", _next_user_agent())
+        if self.logger:
+            self.logger.info("Sending a `%s` request to `%s`.", method.upper(), url)
+        try:
+            httpx_response = self._httpx.request(method, url, headers=headers, **kwargs)
+        except Exception as e:
+            if self.logger:
+                self.logger.exception(
+                    f"`{method.upper()}` request to `{url}` failed."
+                )
+            raise e
+        response = Response()
+        response.status_code = httpx_response.status_code
+        response.headers.update(dict(httpx_response.headers))
+        response._content = httpx_response.content
+        response.encoding = httpx_response.encoding
+        response.url = str(httpx_response.url)
+        response.elapsed = httpx_response.elapsed
+        if self.logger and self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "Request to `%s` completed with status code `%s` in %s.",
+                url,
+                response.status_code,
+                Timer.format_time(response.elapsed.total_seconds(), True),
+            )
+        return response
+
+    @override
+    def close(self):
+        if self._httpx is not None:
+            self._httpx.close()
+        super().close()
 
     @override
     def send(
@@ -133,7 +634,7 @@ class Session(requests.Session):
     ) -> requests.Response:
         if self.logger:
             self.logger.info(
-                f"Sending a `{request.method}` request to `{request.url}`."
+                "Sending a `%s` request to `%s`.", request.method, request.url
             )
         try:
             response = super().send(request, **kwargs)
@@ -143,7 +644,9 @@ class Session(requests.Session):
                     f"`{request.method}` request to `{request.url}` failed."
                 )
             raise e
-        if self.logger:
+        # Guarded so the history scan and time formatting don't run when INFO
+        # is filtered out
+        if self.logger and self.logger.isEnabledFor(logging.INFO):
             logged_response = response
             # Without checking `history` all redirected responses will be logged with the same details as the final response
             for response_ in response.history:
@@ -151,19 +654,45 @@ class Session(requests.Session):
                     logged_response = response_
                     break
             self.logger.info(
-                f"Request to `{request.url}` completed with status code `{logged_response.status_code}` in {Timer.format_time(logged_response.elapsed.total_seconds(), True)}."
+                "Request to `%s` completed with status code `%s` in %s.",
+                request.url,
+                logged_response.status_code,
+                Timer.format_time(logged_response.elapsed.total_seconds(), True),
             )
         return response
 
 
+@lru_cache(maxsize=8)
+def _shared_session(
+    randomize_useragent: bool | Literal["per-session", "per-request"],
+    retry_count: int,
+    retry_backoff_factor: float,
+    retry_on_codes: frozenset[int],
+    logger: loggi.Logger | logging.Logger | None,
+) -> Session:
+    """Returns a persistent `Session` for the module level `request` function.
+
+    One session per distinct settings combo, so repeated calls to the same
+    host reuse pooled TCP/TLS connections (keep-alive) instead of paying a
+    fresh handshake per call."""
+    return Session(
+        randomize_useragent=randomize_useragent,
+        retry_count=retry_count,
+        retry_backoff_factor=retry_backoff_factor,
+        retry_on_codes=retry_on_codes,
+        logger=logger,
+    )
+
+
 def request(
     url: str,
     method: str = "get",
-    randomize_useragent: bool = True,
+    randomize_useragent: bool | Literal["per-session", "per-request"] = True,
     retry_count: int = 3,
     retry_backoff_factor: float = 0.1,
-    retry_on_codes: list[int] = retry_on_codes,
+    retry_on_codes: Collection[int] = retry_on_codes,
     logger: loggi.Logger | logging.Logger | None = None,
+    session: Session | None = None,
     *args: Any,
     **kwargs: Any,
 ) -> Response:
@@ -178,6 +707,12 @@ def request(
     * `retry_backoff_factor`: For each failed request, the time before retrying will be `retry_backoff_factor * (2 ** retry_number)`
     * `retry_on_codes`: List of status codes to retry requests on. Default is `[408, 413, 444, 499, 500, 502, 503, 504]`.
     * `logger`: A logging instance to use.
+    * `session`: An optional `Session` to send the request through, reusing its
+    connection pool (keep-alive) instead of building a new session per call.
+    When given, the session's own settings apply and the useragent/retry/logger
+    params above are ignored. When not given, a persistent module-level session
+    matching the above params is used, so repeated calls still reuse
+    connections.
 
     `params`: dict, list of tuples or bytes to send in the query string for the :class:`Request`.
     `data`: dict, list of tuples, bytes, or file-like object to send in the body of the :class:`Request`.
@@ -201,11 +736,14 @@ def request(
     `stream`: if ``False``, the response content will be immediately downloaded.
     `cert`: if String, path to ssl client cert file (.pem). If Tuple, ('cert', 'key') pair.
     """
-    with Session(
-        randomize_useragent=randomize_useragent,
-        retry_count=retry_count,
-        retry_backoff_factor=retry_backoff_factor,
-        retry_on_codes=retry_on_codes,
-        logger=logger,
-    ) as session:
-        return session.request(method, url, *args, **kwargs)
+    if session is None:
+        # Persistent per-settings session so back to back calls to the same
+        # host keep their connections alive
+        session = _shared_session(
+            randomize_useragent,
+            retry_count,
+            retry_backoff_factor,
+            frozenset(retry_on_codes),
+            logger,
+        )
+    return session.request(method, url, *args, **kwargs)
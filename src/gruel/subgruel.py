@@ -1,10 +1,18 @@
 import argparse
+from functools import lru_cache
+from string import Template
 
 from pathier import Pathier
 
 root = Pathier(__file__).parent
 
 
+@lru_cache(maxsize=1)
+def _get_template() -> Template:
+    """Returns the scaffold as a `Template`, read and prepped once per process."""
+    return Template((root / "template.py").read_text().replace("SubGruel", "$name"))
+
+
 def get_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser()
 
@@ -21,9 +29,7 @@ def get_args() -> argparse.Namespace:
 def main(args: argparse.Namespace | None = None):
     if not args:
         args = get_args()
-    content = (
-        (root / "template.py").read_text().replace("SubGruel", args.name.capitalize())
-    )
+    content = _get_template().safe_substitute(name=args.name.capitalize())
     (Pathier.cwd() / f"{args.name.lower()}.py").write_text(content)
 
 
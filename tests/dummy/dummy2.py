@@ -1,3 +1,5 @@
+from operator import itemgetter
+
 from pathier import Pathier, Pathish
 from typing_extensions import Any, Sequence, override
 
@@ -20,9 +22,11 @@ class DummyGruel(Gruel):
     def parse_item(self, item: dict[str, Any]) -> list[str]:
         titles = [item["slideshow"]["title"]]
         slides = item["slideshow"]["slides"]
-        titles.extend([slide["title"] for slide in slides])
+        titles.extend(map(itemgetter("title"), slides))
         return titles
 
     @override
     def store_items(self, items: Sequence[list[str]]):
-        (root / "dummy_data.txt").join(items[0])
+        # Single pre-joined buffer and one write instead of Pathier.join's
+        # text-mode encode pass
+        (root / "dummy_data.txt").write_bytes("\n".join(items[0]).encode())
@@ -0,0 +1,84 @@
+import pytest
+import scrapetools
+
+from gruel.requests import SelectolaxLinkScraper
+
+pytest.importorskip("selectolax")
+
+page_url = "https://www.somesite.com/page"
+
+source = """<html>
+<head>
+<link href="/styles/main.css" rel="stylesheet">
+<script src="/js/app.js"></script>
+<script src="https://cdn.example.com/lib.js"></script>
+</head>
+<body>
+<a href="/page1">page1</a>
+<a href="page2/subpage">page2</a>
+<a href="https://www.somesite.com/page3">page3</a>
+<a href="https://external.org/stuff">external</a>
+<a href="#section">fragment</a>
+<a href="mailto:someone@somesite.com">mail</a>
+<img src="/images/logo.png">
+<img data-src="https://cdn.example.com/banner.jpg">
+<div data-url="/dynamic/content"></div>
+<p>Check out https://www.blog.somesite.com/post for more.</p>
+</body>
+</html>"""
+
+
+def get_scrapers() -> tuple[scrapetools.LinkScraper, SelectolaxLinkScraper]:
+    scrapetools_scraper = scrapetools.LinkScraper(source, page_url)
+    scrapetools_scraper.scrape_page()
+    selectolax_scraper = SelectolaxLinkScraper(source, page_url)
+    selectolax_scraper.scrape_page()
+    return scrapetools_scraper, selectolax_scraper
+
+
+def test__parity_by_link_type():
+    scrapetools_scraper, selectolax_scraper = get_scrapers()
+    for link_type in ("all", "page", "img", "script"):
+        assert scrapetools_scraper.get_links(link_type) == selectolax_scraper.get_links(
+            link_type
+        )
+
+
+def test__parity_same_site_only():
+    scrapetools_scraper, selectolax_scraper = get_scrapers()
+    assert scrapetools_scraper.get_links(
+        same_site_only=True
+    ) == selectolax_scraper.get_links(same_site_only=True)
+
+
+def test__parity_excluded_links():
+    scrapetools_scraper, selectolax_scraper = get_scrapers()
+    excluded_links = ["https://www.somesite.com/page1"]
+    assert scrapetools_scraper.get_links(
+        "page", excluded_links=excluded_links
+    ) == selectolax_scraper.get_links("page", excluded_links=excluded_links)
+
+
+def test__link_formatting_and_classification():
+    _, scraper = get_scrapers()
+    links = scraper.get_links()
+    # Relative links are resolved against the page url
+    assert "https://www.somesite.com/page1" in links
+    assert "https://www.somesite.com/page2/subpage" in links
+    # Fragments and mailto links are filtered out
+    assert not any("#" in link or "mailto" in link for link in links)
+    # Bare urls in text are picked up
+    assert "https://www.blog.somesite.com/post" in links
+    assert scraper.get_links("img") == [
+        "https://cdn.example.com/banner.jpg",
+        "https://www.somesite.com/images/logo.png",
+    ]
+    assert scraper.get_links("script") == [
+        "https://cdn.example.com/lib.js",
+        "https://www.somesite.com/js/app.js",
+    ]
+    # External domains are dropped with same_site_only
+    same_site = scraper.get_links(same_site_only=True)
+    assert "https://external.org/stuff" not in same_site
+    assert "https://cdn.example.com/lib.js" not in same_site
+    assert "https://www.somesite.com/page3" in same_site
@@ -1,5 +1,3 @@
-import pytest
-
 from gruel import models
 
 raw_url = "https://www.website.com/page1/page2?var1=val1&var2=val2#frag"
@@ -55,8 +53,8 @@ def test__Url__eq__():
     assert url1 == url2
     url2.netloc = "anotherwebsite.org"
     assert url1 != url2
-    with pytest.raises(ValueError):
-        result = "yeet" == url1
+    assert "yeet" != url1
+    assert url1 != "yeet"
 
 
 def test__Url__hash__():
@@ -66,6 +64,15 @@ def test__Url__hash__():
     url_dict = {url1: 1, url2: 2}
 
 
+def test__Url_query_params():
+    url = models.Url(raw_url)
+    assert url.query_params == {"var1": ["val1"], "var2": ["val2"]}
+    url.query = "var1=val3&var1=val4&var2="
+    assert url.query_params == {"var1": ["val3", "val4"], "var2": [""]}
+    url.address = "https://www.website.com/page1"
+    assert url.query_params == {}
+
+
 def test__Url_is_same_site():
     url1 = models.Url(raw_url)
     url2 = models.Url(raw_url)